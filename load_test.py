@@ -0,0 +1,324 @@
+"""Concurrent load test for app.py.
+
+Starts one real `streamlit run` server (see load_test_server.py, which installs
+in-memory fake Google Sheets and SMTP backends) and drives many concurrent scripted
+clinician sessions (login -> analyze -> insights -> sign out) against it over
+Streamlit's websocket protocol, the way browsers do. All sessions share the one
+app.py instance, so reruns queue behind time.sleep, bcrypt and the per-rerun
+model.pkl load exactly as they would in production.
+
+Usage:
+    python load_test.py --workers 1,2,4,8,16 --sessions 5
+"""
+import argparse
+import asyncio
+import csv
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.asyncio.client import connect
+
+from load_test_server import TEST_PASSWORD, account_email
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+SERVER_PATH = os.path.join(BASE_DIR, "load_test_server.py")
+STEPS = ["login", "analyze", "insights", "sign_out"]
+# st.error texts that mean the journey broke (High Risk results also use st.error).
+FAILURE_TEXTS = [
+    "Database Connection Failed",
+    "Login Error",
+    "User not found.",
+    "Incorrect Password",
+    "model.pkl' not found",
+]
+
+# --- 1. SERVER ---
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def start_server(app_path, num_users, startup_timeout=60):
+    """Run load_test_server.py for `app_path` and yield its websocket URL."""
+    port = _free_port()
+    log = tempfile.NamedTemporaryFile(prefix="cardio-loadtest-", suffix=".log", delete=False)
+    # app.py opens model.pkl relative to the working directory.
+    proc = subprocess.Popen(
+        [sys.executable, SERVER_PATH, app_path, "--port", str(port), "--users", str(num_users)],
+        cwd=os.path.dirname(app_path), stdout=log, stderr=subprocess.STDOUT,
+    )
+    try:
+        deadline = time.time() + startup_timeout
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Streamlit server exited early; see {log.name}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                    break
+            except OSError:
+                if time.time() > deadline:
+                    raise RuntimeError(f"Streamlit server did not start; see {log.name}")
+                time.sleep(0.2)
+        yield f"ws://127.0.0.1:{port}/_stcore/stream"
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        log.close()
+
+# --- 2. SCRIPTED SESSION ---
+
+class BrowserSession:
+    """Minimal Streamlit websocket client: sends reruns, records the rendered page."""
+
+    def __init__(self, ws, timeout):
+        self.ws = ws
+        self.timeout = timeout
+        self.widgets = {}
+        self.texts = []
+        self.errors = []
+        self.exceptions = []
+
+    def text_input(self, label, value):
+        return WidgetState(id=self._id("text_input", label), string_value=value)
+
+    def radio(self, label, option):
+        return WidgetState(id=self._id("radio", label), string_value=option)
+
+    def click(self, label):
+        return WidgetState(id=self._id("button", label), trigger_value=True)
+
+    def has(self, kind, label):
+        return (kind, label) in self.widgets
+
+    def _id(self, kind, label):
+        try:
+            return self.widgets[(kind, label)]
+        except KeyError:
+            raise LookupError(f"Widget not found: {label!r}") from None
+
+    async def rerun(self, *states):
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(states)
+        await self.ws.send(msg.SerializeToString())
+        await asyncio.wait_for(self._read_run(), self.timeout)
+
+    async def _read_run(self):
+        self._reset()
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._record(fwd.delta.new_element)
+            elif kind == "script_finished":
+                # st.rerun() ends the run early; the page is whatever the next run draws.
+                if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    self._reset()
+                else:
+                    return
+
+    def _reset(self):
+        self.widgets, self.texts, self.errors, self.exceptions = {}, [], [], []
+
+    def _record(self, element):
+        kind = element.WhichOneof("type")
+        if kind in ("button", "text_input", "radio"):
+            widget = getattr(element, kind)
+            self.widgets[(kind, widget.label)] = widget.id
+        elif kind == "markdown":
+            self.texts.append(element.markdown.body)
+        elif kind == "alert" and element.alert.format == Alert.ERROR:
+            self.errors.append(element.alert.body)
+        elif kind == "exception":
+            self.exceptions.append(element.exception.message)
+
+    def check(self, step):
+        if self.exceptions:
+            raise RuntimeError(f"{step}: {self.exceptions[0]}")
+        for body in self.errors:
+            if any(text in body for text in FAILURE_TEXTS):
+                raise RuntimeError(f"{step}: {body}")
+
+    def require(self, step, ok, what):
+        self.check(step)
+        if not ok:
+            raise RuntimeError(f"{step}: {what} not reached")
+
+
+async def run_session(url, email, timeout):
+    """Run one full clinician journey and return per-step latencies in seconds."""
+    timings = {}
+    async with connect(url, subprotocols=["streamlit"], max_size=None, open_timeout=timeout) as ws:
+        page = BrowserSession(ws, timeout)
+        await page.rerun()
+        page.require("load", page.has("text_input", "Institutional Email"), "login page")
+
+        start = time.perf_counter()
+        await page.rerun(page.text_input("Institutional Email", email),
+                         page.text_input("Access Key", TEST_PASSWORD),
+                         page.click("Authenticate Dashboard"))
+        timings["login"] = time.perf_counter() - start
+        page.require("login", page.has("radio", "Menu"), "dashboard")
+
+        start = time.perf_counter()
+        await page.rerun(page.click("🚀 Analyze Risk Profile"))
+        timings["analyze"] = time.perf_counter() - start
+        page.require("analyze", "### Assessment Result" in page.texts, "risk result")
+
+        start = time.perf_counter()
+        await page.rerun(page.radio("Menu", "🧠 Insights"))
+        timings["insights"] = time.perf_counter() - start
+        page.require("insights", "## 📊 Clinical Data Science Report" in page.texts, "insights report")
+
+        start = time.perf_counter()
+        await page.rerun(page.radio("Menu", "🧠 Insights"), page.click("🚪 Sign Out"))
+        timings["sign_out"] = time.perf_counter() - start
+        page.require("sign_out", page.has("text_input", "Institutional Email"), "login page")
+
+    timings["session"] = sum(timings[s] for s in STEPS)
+    return timings
+
+# --- 3. LOAD GENERATION ---
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+async def run_level(url, workers, sessions, timeout):
+    """Run `sessions` back-to-back journeys on each of `workers` concurrent users."""
+    results, errors = [], []
+
+    async def worker(idx):
+        for _ in range(sessions):
+            try:
+                results.append(await run_session(url, account_email(idx), timeout))
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}" if not str(e) else str(e))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(idx) for idx in range(workers)))
+    elapsed = time.perf_counter() - start
+
+    row = {
+        "workers": workers,
+        "sessions": len(results),
+        "errors": len(errors),
+        "elapsed_s": elapsed,
+        "throughput_sps": len(results) / elapsed if elapsed else 0.0,
+    }
+    for name in STEPS + ["session"]:
+        values = [r[name] for r in results]
+        for pct in (50, 95, 99):
+            row[f"{name}_p{pct}"] = percentile(values, pct)
+    return row, errors
+
+
+def find_saturation(rows, min_gain):
+    """First worker count whose throughput gain is below `min_gain` of linear scaling.
+
+    Going from 2 to 4 users ideally doubles throughput and from 2 to 3 adds 50%, so
+    the threshold scales with the worker ratio between neighbouring levels.
+    """
+    for prev, cur in zip(rows, rows[1:]):
+        ideal_gain = cur["workers"] / prev["workers"] - 1
+        if prev["throughput_sps"] and cur["throughput_sps"] < prev["throughput_sps"] * (1 + min_gain * ideal_gain):
+            return cur["workers"]
+    return None
+
+# --- 4. REPORT ---
+
+def print_report(rows, saturation):
+    header = f"{'workers':>7} {'ok':>5} {'err':>4} {'sess/s':>7} {'p50 s':>7} {'p95 s':>7} {'p99 s':>7}"
+    for name in STEPS:
+        header += f" {name + ' p95':>13}"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        line = (f"{r['workers']:>7} {r['sessions']:>5} {r['errors']:>4} {r['throughput_sps']:>7.2f} "
+                f"{r['session_p50']:>7.2f} {r['session_p95']:>7.2f} {r['session_p99']:>7.2f}")
+        for name in STEPS:
+            line += f" {r[name + '_p95']:>13.2f}"
+        print(line)
+    print()
+    if saturation is None:
+        print("No saturation point reached; try higher worker counts.")
+    else:
+        print(f"Saturation at {saturation} concurrent users (throughput stopped scaling).")
+
+
+def _parse_workers(parser, value):
+    try:
+        levels = sorted({int(w) for w in value.split(",")})
+    except ValueError:
+        parser.error(f"--workers must be comma-separated integers, got {value!r}")
+    if levels[0] < 1:
+        parser.error("--workers values must be at least 1")
+    return levels
+
+
+async def _run(url, levels, sessions, timeout):
+    # Warm-up session so imports and first-run caches are not billed to level 1.
+    await run_session(url, account_email(0), timeout)
+    rows = []
+    for workers in levels:
+        print(f"Running {workers} concurrent user(s) x {sessions} session(s)...")
+        row, errors = await run_level(url, workers, sessions, timeout)
+        for err in sorted(set(errors)):
+            print(f"  ⚠️ {err}")
+        rows.append(row)
+    print()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for CardioRisk Pro.")
+    parser.add_argument("--app", default=APP_PATH, help="Path to the Streamlit app script")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated concurrent user counts")
+    parser.add_argument("--sessions", type=int, default=3, help="Sessions per worker at each level")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-rerun timeout in seconds")
+    parser.add_argument("--min-gain", type=float, default=0.10,
+                        help="Fraction of linear throughput scaling below which a level counts "
+                             "as saturated (scaled by the worker ratio between levels)")
+    parser.add_argument("--csv", help="Optional path to write the per-level results")
+    args = parser.parse_args()
+
+    levels = _parse_workers(parser, args.workers)
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+
+    with start_server(os.path.abspath(args.app), max(levels)) as url:
+        rows = asyncio.run(_run(url, levels, args.sessions, args.timeout))
+
+    print_report(rows, find_saturation(rows, args.min_gain))
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Results written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Bootstrap for load_test.py: one real `streamlit run` server with fake backends.
+
+Installs in-memory fake Google Sheets and SMTP backends, then starts Streamlit in this
+same process, so every session of app.py sees the fakes. An empty secrets.toml in a
+temp directory sends get_database() down the gspread.service_account branch.
+
+Usage:
+    python load_test_server.py app.py --port 8599 --users 16
+"""
+import argparse
+import os
+import smtplib
+import sys
+import tempfile
+import threading
+
+import bcrypt
+import gspread
+from streamlit.web import cli as stcli
+
+TEST_PASSWORD = "loadtest"
+
+
+def account_email(idx):
+    return f"clinician{idx}@hospital.test"
+
+# --- 1. FAKE BACKENDS ---
+
+class FakeCell:
+    def __init__(self, row, col, value):
+        self.row = row
+        self.col = col
+        self.value = value
+
+
+class FakeSheet:
+    """In-memory stand-in for the gspread worksheet used by app.py."""
+
+    def __init__(self):
+        self.rows = [["Email", "Password"]]
+        self.lock = threading.Lock()
+
+    def find(self, query):
+        with self.lock:
+            for r, row in enumerate(self.rows, start=1):
+                for c, value in enumerate(row, start=1):
+                    if value == query:
+                        return FakeCell(r, c, value)
+        return None
+
+    def cell(self, row, col):
+        with self.lock:
+            return FakeCell(row, col, self.rows[row - 1][col - 1])
+
+    def append_row(self, values):
+        with self.lock:
+            self.rows.append(list(values))
+
+    def update_cell(self, row, col, value):
+        with self.lock:
+            self.rows[row - 1][col - 1] = value
+
+
+class FakeSpreadsheet:
+    def __init__(self, sheet):
+        self.sheet1 = sheet
+
+
+class FakeClient:
+    def __init__(self, sheet):
+        self.sheet = sheet
+
+    def open_by_url(self, url):
+        return FakeSpreadsheet(self.sheet)
+
+    def open(self, title):
+        return FakeSpreadsheet(self.sheet)
+
+
+class FakeSMTP:
+    """Guard against real network I/O: the scripted journey never sends email."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        pass
+
+
+def install_fakes(num_users):
+    sheet = FakeSheet()
+    # One hash shared by every account keeps setup fast; checkpw cost is unchanged.
+    hashed_pw = bcrypt.hashpw(TEST_PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    for i in range(num_users):
+        sheet.append_row([account_email(i), hashed_pw])
+
+    client = FakeClient(sheet)
+    gspread.service_account = lambda *args, **kwargs: client
+    gspread.service_account_from_dict = lambda *args, **kwargs: client
+    smtplib.SMTP_SSL = FakeSMTP
+    smtplib.SMTP = FakeSMTP
+    return sheet
+
+# --- 2. SERVER ---
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve app.py with fake backends for load testing.")
+    parser.add_argument("app", help="Path to the Streamlit app script")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--users", type=int, default=1, help="Number of test accounts to create")
+    args = parser.parse_args()
+
+    install_fakes(args.users)
+
+    secrets_dir = tempfile.mkdtemp(prefix="cardio-loadtest-")
+    secrets_path = os.path.join(secrets_dir, "secrets.toml")
+    open(secrets_path, "w").close()
+
+    sys.argv = [
+        "streamlit", "run", args.app,
+        "--server.port", str(args.port),
+        "--server.address", "127.0.0.1",
+        "--server.headless", "true",
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+        "--secrets.files", secrets_path,
+    ]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import asyncio
+import math
+
+from load_test import APP_PATH, STEPS, find_saturation, percentile, run_session, start_server
+from load_test_server import account_email
+
+
+def _level(workers, throughput):
+    return {"workers": workers, "throughput_sps": throughput}
+
+
+def test_percentile_nearest_rank():
+    values = list(range(100, 0, -1))  # 1..100, unsorted
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+
+
+def test_percentile_small_sample():
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([3.0, 1.0, 2.0], 99) == 3.0
+    assert percentile([7.0], 95) == 7.0
+
+
+def test_percentile_empty_is_nan():
+    assert math.isnan(percentile([], 95))
+
+
+def test_saturation_when_gain_drops_below_threshold():
+    rows = [_level(1, 1.0), _level(2, 1.9), _level(4, 2.0), _level(8, 1.5)]
+    assert find_saturation(rows, 0.10) == 4
+
+
+def test_no_saturation_while_scaling():
+    rows = [_level(1, 1.0), _level(2, 2.0), _level(4, 3.9)]
+    assert find_saturation(rows, 0.10) is None
+
+
+def test_saturation_at_zero_throughput():
+    rows = [_level(1, 1.0), _level(2, 0.0)]
+    assert find_saturation(rows, 0.10) == 2
+
+
+def test_zero_throughput_baseline_is_skipped():
+    rows = [_level(1, 0.0), _level(2, 1.0), _level(4, 1.05)]
+    assert find_saturation(rows, 0.10) == 4
+
+
+def test_saturation_threshold_scales_with_worker_ratio():
+    # 2 -> 3 users ideally adds 50%, so a 10% threshold needs a 5% gain.
+    assert find_saturation([_level(2, 2.0), _level(3, 2.12)], 0.10) is None
+    assert find_saturation([_level(2, 2.0), _level(3, 2.08)], 0.10) == 3
+    # 2 -> 4 users ideally adds 100%, so the same 6% gain is saturated.
+    assert find_saturation([_level(2, 2.0), _level(4, 2.12)], 0.10) == 4
+
+
+def test_single_session_against_server():
+    with start_server(APP_PATH, num_users=1) as url:
+        timings = asyncio.run(run_session(url, account_email(0), timeout=60))
+    assert set(timings) == set(STEPS) | {"session"}
+    assert all(timings[step] > 0 for step in STEPS)